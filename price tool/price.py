@@ -1,22 +1,25 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 import sqlite3
 from datetime import datetime
 import os
 import sys
 import webbrowser
-from typing import List, Tuple, Dict, Optional
+from typing import Iterable, List, Tuple, Dict, Optional
 import logging
 from dataclasses import dataclass
-from urllib.parse import quote_plus
+from operator import attrgetter
+from urllib.parse import quote_plus, urlparse
 import time
 import random
+import re
 
 def clear_terminal():
     os.system('cls' if os.name == 'nt' else 'clear')
     sys.stdout.write("\033[H")
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     name: str
     price: Optional[float]  # Changed to Optional[float] to handle None values
@@ -39,13 +42,24 @@ class Product:
 class DatabaseManager:
     def __init__(self, db_name: str = 'product_prices.db'):
         self.db_name = db_name
+        # History lookups read an in-memory copy of the products table; writes go to
+        # the attached file as 'disk' and are then mirrored into memory.
+        # Autocommit mode; writes open their own transaction
+        self.conn = sqlite3.connect(':memory:', isolation_level=None, check_same_thread=False)
+        self.conn.execute('ATTACH DATABASE ? AS disk', (db_name,))
+        self.conn.execute('PRAGMA disk.synchronous=NORMAL')
+        self.conn.execute('PRAGMA disk.cache_size=-20000')  # 20 MB
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        # REPLACE only fires the delete trigger below when recursive triggers are on
+        self.conn.execute('PRAGMA recursive_triggers=ON')
         self.setup_database()
+        self.refresh_cache()
 
     def setup_database(self) -> None:
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS products (
+        cursor = self.conn.cursor()
+        for schema in ('disk', 'main'):
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {schema}.products (
                     id INTEGER PRIMARY KEY,
                     name TEXT,
                     price REAL,
@@ -59,53 +73,183 @@ class DatabaseManager:
                     UNIQUE(name, website, timestamp)
                 )
             ''')
-            conn.commit()
+        cursor.execute('PRAGMA disk.journal_mode=WAL')
+
+        # Full-text index over the in-memory table's names, kept in sync by triggers
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS main.products_fts
+            USING fts5(name, content='products', content_rowid='id')
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS main.products_ai AFTER INSERT ON products BEGIN
+                INSERT INTO products_fts(rowid, name) VALUES (new.id, new.name);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS main.products_ad AFTER DELETE ON products BEGIN
+                INSERT INTO products_fts(products_fts, rowid, name) VALUES ('delete', old.id, old.name);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS main.products_au AFTER UPDATE ON products BEGIN
+                INSERT INTO products_fts(products_fts, rowid, name) VALUES ('delete', old.id, old.name);
+                INSERT INTO products_fts(rowid, name) VALUES (new.id, new.name);
+            END
+        ''')
+
+    def refresh_cache(self) -> None:
+        # Copy over rows the in-memory table hasn't seen yet; new rows always get higher ids
+        self.conn.execute('''
+            INSERT OR REPLACE INTO main.products
+            SELECT * FROM disk.products
+            WHERE id > (SELECT COALESCE(MAX(id), 0) FROM main.products)
+        ''')
 
     def save_product(self, product: Product) -> None:
         if not product.name or product.price is None:  # Skip invalid products
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        with self.conn:  # Commits on success, rolls back on error
+            cursor = self.conn.cursor()
+            cursor.execute('BEGIN')
             cursor.execute('''
-                INSERT OR REPLACE INTO products 
+                INSERT OR REPLACE INTO disk.products 
                 (name, price, website, url, timestamp, description, 
                 rating, num_reviews, availability)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 product.name, product.price, product.website, product.url,
-                product.timestamp, product.description, product.rating,
+                product.timestamp.isoformat(sep=' '), product.description, product.rating,
                 product.num_reviews, product.availability
             ))
-            conn.commit()
+            self.refresh_cache()
+
+    def save_products(self, products: Iterable[Product]) -> None:
+        rows = (
+            (
+                product.name, product.price, product.website, product.url,
+                product.timestamp.isoformat(sep=' '), product.description, product.rating,
+                product.num_reviews, product.availability
+            )
+            for product in products
+            if product.name and product.price is not None  # Skip invalid products
+        )
+
+        with self.conn:  # Commits on success, rolls back on error
+            cursor = self.conn.cursor()
+            cursor.execute('BEGIN')
+            cursor.executemany('''
+                INSERT OR REPLACE INTO disk.products 
+                (name, price, website, url, timestamp, description, 
+                rating, num_reviews, availability)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self.refresh_cache()
+
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        # Quote every word so punctuation isn't read as FTS syntax; '*' matches word prefixes
+        return ' '.join('"{}"*'.format(word.replace('"', '""')) for word in text.split())
 
     def get_price_history(self, product_name: str) -> List[Tuple]:
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT website, price, timestamp, url
-                FROM products 
-                WHERE name LIKE ? AND price IS NOT NULL
-                ORDER BY timestamp DESC
-            ''', (f'%{product_name}%',))
-            return cursor.fetchall()
+        match = self._fts_query(product_name)
+        if not match:
+            return []
+
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT website, price, timestamp, url
+            FROM main.products 
+            WHERE id IN (SELECT rowid FROM products_fts WHERE products_fts MATCH ?)
+            AND price IS NOT NULL
+            ORDER BY timestamp DESC
+        ''', (match,))
+        return cursor.fetchall()
+
+    def close(self) -> None:
+        self.conn.close()
 
 class WebScraper:
+    MAX_RETRIES = 3
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    MAX_RETRY_AFTER = 60  # Seconds; longer Retry-After requests are capped
+    # Result cards sit near the top; the tail of large pages is footer and recommendations
+    MAX_BYTES = 2_000_000
+    _PRICE_RE = re.compile(r'[^\d.]')
+    _RATING_RE = re.compile(r'\d+(?:\.\d+)?')
+
     def __init__(self):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9',
             'Accept-Language': 'en-US,en;q=0.9',
         }
-        self.session = requests.Session()
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._next_ok: Dict[str, float] = {}
         self.logger = logging.getLogger(__name__)
 
-    def get_soup(self, url: str) -> Optional[BeautifulSoup]:
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created on first use so it binds to the running event loop, then kept
+        # open so later searches reuse its pooled keep-alive connections
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=32, limit_per_host=4)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self.session
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _read_capped(self, response: aiohttp.ClientResponse) -> bytes:
+        chunks = []
+        remaining = self.MAX_BYTES
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk[:remaining])
+            remaining -= len(chunk)
+            if remaining <= 0:
+                break
+        return b''.join(chunks)
+
+    async def _fetch(self, url: str) -> bytes:
+        session = self._get_session()
+        for attempt in range(self.MAX_RETRIES + 1):
+            last_attempt = attempt == self.MAX_RETRIES
+            delay = 2 ** attempt  # Back off 1s, 2s, 4s between retries
+            # Retries are paced like any other request to the host
+            await self._throttle(url)
+            try:
+                async with session.get(url) as response:
+                    if last_attempt or response.status not in self.RETRY_STATUSES:
+                        response.raise_for_status()  # Raise exception for bad status codes
+                        return await self._read_capped(response)
+                    retry_after = response.headers.get('Retry-After', '')
+                    if response.status in (429, 503) and retry_after.isdecimal():
+                        delay = max(delay, min(int(retry_after), self.MAX_RETRY_AFTER))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+            await asyncio.sleep(delay)
+        raise RuntimeError(f"Retries exhausted for {url}")  # Unreachable: the last attempt returns or raises
+
+    async def _throttle(self, url: str) -> None:
+        # Space out requests to the same host by 2-4s; different hosts don't wait on each other
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._next_ok.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_ok[host] = time.monotonic() + random.uniform(2, 4)
+
+    async def get_page(self, url: str) -> Optional[bytes]:
         try:
-            time.sleep(random.uniform(2, 4))
-            response = self.session.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()  # Raise exception for bad status codes
-            return BeautifulSoup(response.content, 'html.parser')
+            return await self._fetch(url)
         except Exception as e:
             self.logger.error(f"Error fetching {url}: {str(e)}")
             return None
@@ -114,37 +258,42 @@ class WebScraper:
         if not price_text:
             return None
         try:
-            # Remove currency symbols and whitespace
-            cleaned = ''.join(c for c in price_text if c.isdigit() or c == '.' or c == ',')
-            # Remove thousands separator
-            cleaned = cleaned.replace(',', '')
-            return float(cleaned)
+            # Commas are always thousands separators on US listings; then strip
+            # currency symbols and whitespace
+            cleaned = self._PRICE_RE.sub('', price_text.replace(',', ''))
+            return float(cleaned) if cleaned else None
         except (ValueError, AttributeError):
             return None
 
-    def _scrape_amazon(self, soup: BeautifulSoup, base_url: str) -> List[Product]:
+    def _scrape_amazon(self, tree: LexborHTMLParser, base_url: str, timestamp: datetime) -> List[Product]:
         products = []
-        if not soup:
+        if not tree:
             return products
 
-        items = soup.select('div[data-component-type="s-search-result"]')
-        for item in items:
-            try:
-                name_elem = item.select_one('h2 a span')
-                price_elem = item.select_one('span.a-price > span.a-offscreen')
-                rating_elem = item.select_one('span.a-icon-alt')
-                reviews_elem = item.select_one('span.a-size-base.s-underline-text')
-
+        try:
+            for item in tree.css('div[data-component-type="s-search-result"]'):
+                name_elem = item.css_first('h2 a span')
                 if not name_elem:
                     continue
 
-                name = name_elem.text.strip()
-                price = self._extract_price(price_elem.text) if price_elem else None
-                rating = float(rating_elem.text.split()[0]) if rating_elem else 0.0
-                reviews = int(reviews_elem.text.replace(',', '')) if reviews_elem else 0
+                name = name_elem.text().strip()
+                price_elem = item.css_first('span.a-price > span.a-offscreen')
+                price = self._extract_price(price_elem.text()) if price_elem else None
+                if price is None:
+                    self.logger.debug(f"Skipping Amazon product without a price: {name}")
+                    continue
+
+                rating_elem = item.css_first('span.a-icon-alt')
+                rating_match = self._RATING_RE.match(rating_elem.text().strip()) if rating_elem else None
+                rating = float(rating_match.group()) if rating_match else 0.0
+
+                reviews_elem = item.css_first('span.a-size-base.s-underline-text')
+                reviews_text = reviews_elem.text().strip().replace(',', '') if reviews_elem else ''
+                reviews = int(reviews_text) if reviews_text.isdecimal() else 0
 
-                url_elem = item.select_one('h2 a')
-                url = 'https://www.amazon.com' + url_elem['href'] if url_elem and 'href' in url_elem.attrs else base_url
+                url_elem = item.css_first('h2 a')
+                href = url_elem.attributes.get('href') if url_elem else None
+                url = 'https://www.amazon.com' + href if href else base_url
 
                 if name and url:  # Only add if we have at least name and URL
                     products.append(Product(
@@ -152,40 +301,42 @@ class WebScraper:
                         price=price,
                         website='Amazon',
                         url=url,
-                        timestamp=datetime.now(),
+                        timestamp=timestamp,
                         rating=rating,
                         num_reviews=reviews
                     ))
-            except Exception as e:
-                self.logger.error(f"Error parsing Amazon product: {str(e)}")
-                continue
+        except Exception as e:
+            self.logger.error(f"Error parsing Amazon results, skipped the rest of the page: {str(e)}")
 
         return products
 
-    def _scrape_ebay(self, soup: BeautifulSoup, base_url: str) -> List[Product]:
+    def _scrape_ebay(self, tree: LexborHTMLParser, base_url: str, timestamp: datetime) -> List[Product]:
         products = []
-        if not soup:
+        if not tree:
             return products
 
-        items = soup.select('li.s-item')
-        for item in items:
-            try:
-                name_elem = item.select_one('div.s-item__title')
-                price_elem = item.select_one('span.s-item__price')
-                condition_elem = item.select_one('span.SECONDARY_INFO')
-
+        try:
+            for item in tree.css('li.s-item'):
+                name_elem = item.css_first('div.s-item__title')
                 if not name_elem:
                     continue
 
-                name = name_elem.text.strip()
+                name = name_elem.text().strip()
                 if name.lower() == 'shop on ebay':
                     continue
 
-                price = self._extract_price(price_elem.text) if price_elem else None
-                availability = condition_elem.text.strip() if condition_elem else ''
+                price_elem = item.css_first('span.s-item__price')
+                price = self._extract_price(price_elem.text()) if price_elem else None
+                if price is None:
+                    self.logger.debug(f"Skipping eBay product without a price: {name}")
+                    continue
+
+                condition_elem = item.css_first('span.SECONDARY_INFO')
+                availability = condition_elem.text().strip() if condition_elem else ''
 
-                url_elem = item.select_one('a.s-item__link')
-                url = url_elem['href'] if url_elem and 'href' in url_elem.attrs else base_url
+                url_elem = item.css_first('a.s-item__link')
+                href = url_elem.attributes.get('href') if url_elem else None
+                url = href if href else base_url
 
                 if name and url:  # Only add if we have at least name and URL
                     products.append(Product(
@@ -193,30 +344,38 @@ class WebScraper:
                         price=price,
                         website='eBay',
                         url=url,
-                        timestamp=datetime.now(),
+                        timestamp=timestamp,
                         availability=availability
                     ))
-            except Exception as e:
-                self.logger.error(f"Error parsing eBay product: {str(e)}")
-                continue
+        except Exception as e:
+            self.logger.error(f"Error parsing eBay results, skipped the rest of the page: {str(e)}")
 
         return products
 
-    def scrape_site(self, url: str, site_name: str) -> List[Product]:
-        soup = self.get_soup(url)
-        if not soup:
-            return []
-
+    def _parse(self, body: bytes, site_name: str, url: str, timestamp: datetime) -> List[Product]:
+        tree = LexborHTMLParser(body)
         if site_name == 'amazon':
-            return self._scrape_amazon(soup, url)
+            return self._scrape_amazon(tree, url, timestamp)
         elif site_name == 'ebay':
-            return self._scrape_ebay(soup, url)
+            return self._scrape_ebay(tree, url, timestamp)
         return []
 
+    async def scrape_site(self, url: str, site_name: str) -> List[Product]:
+        body = await self.get_page(url)
+        if not body:
+            return []
+
+        # Every product from one page shares the same scrape time
+        timestamp = datetime.now()
+        # Parsing is CPU-bound; run it in a worker thread so other sites keep downloading
+        return await asyncio.to_thread(self._parse, body, site_name, url, timestamp)
+
 class PriceComparisonTool:
     def __init__(self):
         self.db = DatabaseManager()
         self.scraper = WebScraper()
+        # One loop for the whole session so the scraper's HTTP session survives between searches
+        self.loop = asyncio.new_event_loop()
         self.setup_logging()
         self.site_urls = {
             'amazon': 'https://www.amazon.com/s?k={}',
@@ -234,22 +393,51 @@ class PriceComparisonTool:
         )
 
     def search_products(self, query: str) -> List[Product]:
+        return self.loop.run_until_complete(self._search_products(query))
+
+    async def _search_products(self, query: str) -> List[Product]:
         products = []
         encoded_query = quote_plus(query)
 
         print("\n🔍 Searching for products across multiple sites...")
+        tasks = []
         for site_name, url_template in self.site_urls.items():
-            try:
-                url = url_template.format(encoded_query)
-                print(f"\n⏳ Searching on {site_name.title()}...")
-                site_products = self.scraper.scrape_site(url, site_name)
-                products.extend(site_products)
-            except Exception as e:
-                print(f"Error searching {site_name}: {str(e)}")
+            url = url_template.format(encoded_query)
+            print(f"\n⏳ Searching on {site_name.title()}...")
+            tasks.append(asyncio.create_task(self.scraper.scrape_site(url, site_name)))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for site_name, site_products in zip(self.site_urls, results):
+            if isinstance(site_products, BaseException):
+                print(f"Error searching {site_name}: {str(site_products)}")
                 continue
+            products.extend(site_products)
 
         return products
 
+    def unique_products(self, products: List[Product], query: str) -> List[Product]:
+        # Listings without their own link fall back to the search page URL, so
+        # only deduplicate real product links and keep every fallback row
+        encoded_query = quote_plus(query)
+        search_urls = {url_template.format(encoded_query) for url_template in self.site_urls.values()}
+        kept = [p for p in products if p.url in search_urls]
+        unique = {(p.website, p.url): p for p in products if p.url not in search_urls}
+        return kept + list(unique.values())
+
+    def close(self) -> None:
+        # Same shutdown as asyncio.run: cancel a search interrupted by Ctrl+C before
+        # closing the HTTP session, then finish async generators and to_thread workers
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.run_until_complete(self.scraper.close())
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        self.loop.close()
+        self.db.close()
+
     def display_results(self, products: List[Product]) -> None:
         if not products:
             print("❌ No products found.")
@@ -262,20 +450,21 @@ class PriceComparisonTool:
             print("❌ No products found with valid prices.")
             return
 
-        print("\n🎯 Search Results:")
-        print("-" * 80)
+        # Build the whole listing first and write it out in one go
+        lines = ["\n🎯 Search Results:", "-" * 80]
         
-        sorted_products = sorted(valid_products, key=lambda x: x.price or float('inf'))
+        sorted_products = sorted(valid_products, key=attrgetter('price'))
         for i, product in enumerate(sorted_products, 1):
-            print(f"{i}. {product.name}")
-            print(f"   💰 Price: ${product.price:.2f}" if product.price else "   💰 Price: Not available")
-            print(f"   🏪 Website: {product.website}")
+            lines.append(f"{i}. {product.name}")
+            lines.append(f"   💰 Price: ${product.price:.2f}" if product.price else "   💰 Price: Not available")
+            lines.append(f"   🏪 Website: {product.website}")
             if product.rating > 0:
-                print(f"   ⭐ Rating: {product.rating:.1f} ({product.num_reviews} reviews)")
+                lines.append(f"   ⭐ Rating: {product.rating:.1f} ({product.num_reviews} reviews)")
             if product.availability:
-                print(f"   📦 Status: {product.availability}")
-            print(f"   🔗 URL: {product.url}")
-            print("-" * 80)
+                lines.append(f"   📦 Status: {product.availability}")
+            lines.append(f"   🔗 URL: {product.url}")
+            lines.append("-" * 80)
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         self.offer_best_deals(sorted_products)
 
@@ -287,15 +476,15 @@ class PriceComparisonTool:
             choice = input("\n🎁 Would you like to see the top 5 best deals? (y/n): ").lower()
             if choice == 'y':
                 clear_terminal()
-                print("\n🏆 Top 5 Best Deals:")
-                print("-" * 80)
+                lines = ["\n🏆 Top 5 Best Deals:", "-" * 80]
                 
                 for i, product in enumerate(products[:5], 1):
-                    print(f"{i}. {product.name}")
-                    print(f"   💰 Price: ${product.price:.2f}" if product.price else "   💰 Price: Not available")
-                    print(f"   🏪 Website: {product.website}")
-                    print(f"   🔗 URL: {product.url}")
-                    print("-" * 80)
+                    lines.append(f"{i}. {product.name}")
+                    lines.append(f"   💰 Price: ${product.price:.2f}" if product.price else "   💰 Price: Not available")
+                    lines.append(f"   🏪 Website: {product.website}")
+                    lines.append(f"   🔗 URL: {product.url}")
+                    lines.append("-" * 80)
+                sys.stdout.write('\n'.join(lines) + '\n')
 
                 choice = input("\n🌐 Would you like to open these deals in your browser? (y/n): ").lower()
                 if choice == 'y':
@@ -325,61 +514,63 @@ class PriceComparisonTool:
 def main():
     tool = PriceComparisonTool()
     
-    while True:
-        try:
-            clear_terminal()
-            print("🛍️  US Price Comparison Tool 🛍️")
-            print("\n1. 🔍 Search for products")
-            print("2. 📊 View price history")
-            print("3. 🚪 Exit")
+    try:
+        while True:
+            try:
+                clear_terminal()
+                print("🛍️  US Price Comparison Tool 🛍️")
+                print("\n1. 🔍 Search for products")
+                print("2. 📊 View price history")
+                print("3. 🚪 Exit")
             
-            choice = input("\n✨ Enter your choice (1-3): ").strip()
+                choice = input("\n✨ Enter your choice (1-3): ").strip()
             
-            if choice == '1':
-                clear_terminal()
-                query = input("🔍 Enter product name to search: ").strip()
-                if not query:
-                    print("❌ Please enter a valid product name.")
-                    time.sleep(2)
-                    continue
+                if choice == '1':
+                    clear_terminal()
+                    query = input("🔍 Enter product name to search: ").strip()
+                    if not query:
+                        print("❌ Please enter a valid product name.")
+                        time.sleep(2)
+                        continue
                     
-                products = tool.search_products(query)
-                tool.display_results(products)
+                    products = tool.search_products(query)
+                    tool.display_results(products)
                 
-                # Save valid products to database
-                for product in products:
-                    if product.price is not None:
-                        tool.db.save_product(product)
+                    # Save valid products to database in a single transaction,
+                    # keeping one row per product link
+                    tool.db.save_products(tool.unique_products(products, query))
                 
-                input("\n⏎ Press Enter to continue...")
+                    input("\n⏎ Press Enter to continue...")
                 
-            elif choice == '2':
-                clear_terminal()
-                product_name = input("🔍 Enter product name to view history: ").strip()
-                if not product_name:
-                    print("❌ Please enter a valid product name.")
-                    time.sleep(2)
-                    continue
+                elif choice == '2':
+                    clear_terminal()
+                    product_name = input("🔍 Enter product name to view history: ").strip()
+                    if not product_name:
+                        print("❌ Please enter a valid product name.")
+                        time.sleep(2)
+                        continue
                     
-                tool.show_price_history(product_name)
-                input("\n⏎ Press Enter to continue...")
+                    tool.show_price_history(product_name)
+                    input("\n⏎ Press Enter to continue...")
                 
-            elif choice == '3':
-                clear_terminal()
-                print("👋 Goodbye! Thank you for using Price Comparison Tool!")
-                break
+                elif choice == '3':
+                    clear_terminal()
+                    print("👋 Goodbye! Thank you for using Price Comparison Tool!")
+                    break
                 
-            else:
-                print("❌ Invalid choice. Please try again.")
-                time.sleep(2)
+                else:
+                    print("❌ Invalid choice. Please try again.")
+                    time.sleep(2)
                 
-        except KeyboardInterrupt:
-            clear_terminal()
-            print("\n👋 Program terminated by user.")
-            break
-        except Exception as e:
-            print(f"\n❌ An error occurred: {str(e)}")
-            input("\n⏎ Press Enter to continue...")
+            except KeyboardInterrupt:
+                clear_terminal()
+                print("\n👋 Program terminated by user.")
+                break
+            except Exception as e:
+                print(f"\n❌ An error occurred: {str(e)}")
+                input("\n⏎ Press Enter to continue...")
+    finally:
+        tool.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file